@@ -54,6 +54,9 @@ _SQUEUE_FIELDS = [
     "cpus-per-tres",
 ]
 SQUEUE_FIELD_STRING = ",".join([field + ":{size}" for field in _SQUEUE_FIELDS]).format(size=SQUEUE_FIELD_SIZE)
+# Only split on , if there is ] before
+# For ex. "node-[1,3,4-5],node-[20,30]" should split into ["node-[1,3,4-5]","node-[20,30]"]
+NODE_LIST_SEPARATOR_REGEX = re.compile(r"(?<=]),")
 SLURM_BINARIES_DIR = os.environ.get("SLURM_BINARIES_DIR", "/opt/slurm/bin")
 SCONTROL = f"sudo {SLURM_BINARIES_DIR}/scontrol"
 SINFO = f"{SLURM_BINARIES_DIR}/sinfo"
@@ -171,7 +174,7 @@ def update_all_partitions(state, reset_node_addrs_hostname):
 def _batch_attribute(attribute, batch_size, expected_length=None):
     """Parse an attribute into batches."""
     if type(attribute) is str:
-        attribute = re.split("(?<=]),", attribute)
+        attribute = NODE_LIST_SEPARATOR_REGEX.split(attribute)
     if expected_length and len(attribute) != expected_length:
         raise ValueError
 
@@ -181,9 +184,7 @@ def _batch_attribute(attribute, batch_size, expected_length=None):
 def _batch_node_info(nodenames, nodeaddrs, nodehostnames, batch_size):
     """Group nodename, nodeaddrs, nodehostnames into batches."""
     if type(nodenames) is str:
-        # Only split on , if there is ] before
-        # For ex. "node-[1,3,4-5],node-[20,30]" should split into ["node-[1,3,4-5]","node-[20,30]"]
-        nodenames = re.split("(?<=]),", nodenames)
+        nodenames = NODE_LIST_SEPARATOR_REGEX.split(nodenames)
     nodename_batch = _batch_attribute(nodenames, batch_size)
     nodeaddrs_batch = [None] * len(nodename_batch)
     nodehostnames_batch = [None] * len(nodename_batch)
@@ -14,7 +14,6 @@ import json
 import logging
 import sys
 import traceback
-from collections import ChainMap
 from datetime import datetime, timezone
 from typing import Callable, Dict, Iterable, Iterator, List, Union
 
@@ -35,6 +34,9 @@ _LAUNCH_FAILURE_GROUPING = {
     },
 }
 
+# Launch failure types, in the order their events are published
+_LAUNCH_FAILURE_TYPES = ("other-failures", *dict.fromkeys(_LAUNCH_FAILURE_GROUPING.values()))
+
 
 NODE_LAUNCH_FAILURE_COUNT = {
     "message": "Number of static nodes that failed to launch a backing instance after node maintenance",
@@ -502,6 +504,10 @@ class ClusterEventPublisher:
                 detail=error_detail,
             )
 
+        if not failed_nodes:
+            # Nothing failed to launch, so there are no per-node failure events to publish
+            return
+
         self.publish_event(
             logging.DEBUG,
             **NODE_LAUNCH_FAILURE,
@@ -515,36 +521,22 @@ class ClusterEventPublisher:
 
         The elements contain the number of nodes and the node names in that category.
         """
-        detail_map = {"other-failures": {"count": 0, "error-details": {}}}
-        for failure_type in _LAUNCH_FAILURE_GROUPING.values():
-            detail_map.setdefault(failure_type, {"count": 0, "error-details": {}})
+        detail_map = {
+            failure_type: {"failure-type": failure_type, "count": 0, "error-details": {}}
+            for failure_type in _LAUNCH_FAILURE_TYPES
+        }
 
         for error_code, nodes in failed_nodes.items():
-            failure_type = ClusterEventPublisher._get_failure_type_from_error_code(error_code)
-            error_entry = detail_map.get(failure_type)
-            error_entry.update(
-                {
-                    "count": error_entry.get("count") + len(nodes),
-                }
-            )
-            error_details = error_entry.get("error-details")
-            error_details.update(
-                {
-                    error_code: {
-                        "count": len(nodes),
-                        "nodes": self._generate_node_name_list(list(nodes)),
-                    }
-                }
-            )
-
-        for failure_type, detail in detail_map.items():
-            count = detail.get("count", 0)
-            yield count, {
-                "failure-type": failure_type,
-                "count": count,
-                "error-details": detail.get("error-details", None),
+            detail = detail_map[ClusterEventPublisher._get_failure_type_from_error_code(error_code)]
+            detail["count"] += len(nodes)
+            detail["error-details"][error_code] = {
+                "count": len(nodes),
+                "nodes": self._generate_node_name_list(list(nodes)),
             }
 
+        for detail in detail_map.values():
+            yield detail["count"], detail
+
     def _limit_list(self, source_list: List) -> List:
         """Limit lists of nodes to _max_list_size."""
         value = source_list[: self._max_list_size] if self._max_list_size else source_list
@@ -644,14 +636,11 @@ class ClusterEventPublisher:
     @staticmethod
     def _flatten_failed_launch_nodes(failed_nodes: Dict[str, List[str]]) -> Iterator:
         for error_code, nodes in failed_nodes.items():
-            for node_name in nodes:
-                yield {
-                    "detail": {
-                        "error-code": error_code,
-                        "failure-type": ClusterEventPublisher._get_failure_type_from_error_code(error_code),
-                        "node": {"name": node_name},
-                    }
-                }
+            failure_type = ClusterEventPublisher._get_failure_type_from_error_code(error_code)
+            yield from (
+                {"detail": {"error-code": error_code, "failure-type": failure_type, "node": {"name": node_name}}}
+                for node_name in nodes
+            )
 
     @staticmethod
     def _get_failure_type_from_error_code(error_code: str) -> str:
@@ -678,9 +667,9 @@ class ClusterEventPublisher:
         By using a generator for `event_supplier', large lists or other expensive code can be deferred or skipped over
         altogether when no event will be logged for the given log level.
 
-        This function also supports layering of event properties through the use of a ChainMap. This way, more specific
-        property values can override the more general property values. The priority order from least to most is:
-        `global_args`, the `default_properties' dict formed from named parameters from the outer function
+        This function also supports layering of event properties by merging them into a single dict. This way, more
+        specific property values can override the more general property values. The priority order from least to most
+        is: `global_args`, the `default_properties' dict formed from named parameters from the outer function
         (`_get_event_publisher`) and the inner function (`callable_event_publisher`), `kwargs` from the inner function
         (`callable_event_publisher`), and finally, the specific per event property values from `event_supplier`,
         if provided.
@@ -709,18 +698,15 @@ class ClusterEventPublisher:
                     "message": message,
                     "detail": {},
                 }
+                # The lower priority layers are the same for every supplied event, merge them only once
+                base_properties = {**global_args, **default_properties, **kwargs}
                 if not event_supplier:
                     event_supplier = [kwargs]
                 for event_properties in event_supplier:
                     try:
-                        event = ChainMap(
-                            event_properties,
-                            kwargs,
-                            default_properties,
-                            global_args,
-                        )
+                        event = {**base_properties, **event_properties}
 
-                        event_logger.log(event_level, "%s", json.dumps(dict(event)))
+                        event_logger.log(event_level, "%s", json.dumps(event))
                     except Exception as e:
                         extraction = traceback.extract_stack()
                         logger.error(
@@ -737,29 +723,24 @@ class ClusterEventPublisher:
     def _describe_node(node: SlurmNode):
         if not node:
             return {}
-        node_states = list(node.state_string.split("+"))
-        return (
-            {
-                "name": node.name,
-                "type": "static" if isinstance(node, StaticNode) else "dynamic",
-                "address": node.nodeaddr,
-                "hostname": node.nodehostname,
-                "state-string": node.state_string,
-                "state-reason": node.reason,
-                "state": node_states[0] if node_states else None,
-                "state-flags": node_states[1:],
-                "instance": ClusterEventPublisher._describe_instance(node.instance) if node.instance else None,
-                "partitions": list(node.partitions),
-                "queue-name": node.queue_name,
-                "compute-resource": node.compute_resource_name,
-                "last-busy-time": node.lastbusytime.isoformat(timespec="milliseconds") if node.lastbusytime else None,
-                "slurm-started-time": node.slurmdstarttime.isoformat(timespec="milliseconds")
-                if node.slurmdstarttime
-                else None,
-            }
-            if node
-            else None
-        )
+        return {
+            "name": node.name,
+            "type": "static" if isinstance(node, StaticNode) else "dynamic",
+            "address": node.nodeaddr,
+            "hostname": node.nodehostname,
+            "state-string": node.state_string,
+            "state-reason": node.reason,
+            "state": node.base_state,
+            "state-flags": list(node.state_flags),
+            "instance": ClusterEventPublisher._describe_instance(node.instance),
+            "partitions": list(node.partitions),
+            "queue-name": node.queue_name,
+            "compute-resource": node.compute_resource_name,
+            "last-busy-time": node.lastbusytime.isoformat(timespec="milliseconds") if node.lastbusytime else None,
+            "slurm-started-time": node.slurmdstarttime.isoformat(timespec="milliseconds")
+            if node.slurmdstarttime
+            else None,
+        }
 
     @staticmethod
     def _describe_instance(instance):
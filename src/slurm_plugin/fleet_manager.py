@@ -21,6 +21,9 @@ logger = logging.getLogger(__name__)
 
 
 class EC2Instance:
+    # One of these is created per cluster instance, so avoid carrying a per-object __dict__
+    __slots__ = ("id", "private_ip", "hostname", "launch_time", "slurm_node")
+
     def __init__(self, id, private_ip, hostname, launch_time):
         """Initialize slurm node with attributes."""
         self.id = id
@@ -32,11 +35,11 @@ class EC2Instance:
     def __eq__(self, other):
         """Compare 2 SlurmNode objects."""
         if isinstance(other, EC2Instance):
-            return self.__dict__ == other.__dict__
+            return all(getattr(self, key) == getattr(other, key) for key in self.__slots__)
         return False
 
     def __repr__(self):
-        attrs = ", ".join(["{key}={value}".format(key=key, value=repr(value)) for key, value in self.__dict__.items()])
+        attrs = ", ".join(["{key}={value}".format(key=key, value=repr(getattr(self, key))) for key in self.__slots__])
         return "{class_name}({attrs})".format(class_name=self.__class__.__name__, attrs=attrs)
 
     def __str__(self):
@@ -15,6 +15,7 @@ from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 
 from common.utils import time_is_up
 
@@ -36,6 +37,7 @@ EC2_SCHEDULED_EVENT_CODES = [
 
 
 CONFIG_FILE_DIR = "/etc/parallelcluster/slurm_plugin"
+NODENAME_REGEX = re.compile(r"^([a-z0-9\-]+)-(st|dy)-([a-z0-9\-]+)-\d+$")
 
 
 class PartitionStatus(Enum):
@@ -129,7 +131,10 @@ class SlurmNode(metaclass=ABCMeta):
         self.nodeaddr = nodeaddr
         self.nodehostname = nodehostname
         self.state_string = state
-        self.states = set(state.split("+"))
+        # A Slurm node state is made of a base state followed by state flags, e.g. IDLE+CLOUD+POWERED_DOWN
+        node_states = state.split("+")
+        self.states = set(node_states)
+        self.base_state, self.state_flags = node_states[0], node_states[1:]
         self.partitions = partitions.strip().split(",") if partitions else None
         self.reason = reason
         self.instance = instance
@@ -630,9 +635,11 @@ class ComputeResourceFailureEvent:
     error_code: str
 
 
+# The set of node names is fixed by the Slurm configuration and the same names are parsed at every daemon iteration
+@lru_cache(maxsize=None)
 def parse_nodename(nodename):
     """Parse queue_name, node_type (st vs dy) and instance_type from nodename."""
-    nodename_capture = re.match(r"^([a-z0-9\-]+)-(st|dy)-([a-z0-9\-]+)-\d+$", nodename)
+    nodename_capture = NODENAME_REGEX.match(nodename)
     if not nodename_capture:
         raise InvalidNodenameError
 
@@ -31,6 +31,22 @@ def test_slurm_node_is_nodeaddr_set(node, expected_output):
     assert_that(node.is_nodeaddr_set()).is_equal_to(expected_output)
 
 
+@pytest.mark.parametrize(
+    "node, expected_base_state, expected_state_flags",
+    [
+        (StaticNode("queue1-st-c5xlarge-1", "nodeip", "nodehostname", "DOWN", "queue1"), "DOWN", []),
+        (
+            DynamicNode("queue1-dy-c5xlarge-1", "nodeip", "nodehostname", "IDLE+CLOUD+POWERED_DOWN", "queue1"),
+            "IDLE",
+            ["CLOUD", "POWERED_DOWN"],
+        ),
+    ],
+)
+def test_slurm_node_state_parsing(node, expected_base_state, expected_state_flags):
+    assert_that(node.base_state).is_equal_to(expected_base_state)
+    assert_that(node.state_flags).is_equal_to(expected_state_flags)
+
+
 @pytest.mark.parametrize(
     "node, expected_output",
     [
@@ -10,31 +10,58 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import copy
 import json
 import logging
 from datetime import datetime, timezone
 from types import SimpleNamespace
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
 import pytest
-from assertpy import assert_that
 from slurm_plugin.cluster_event_publisher import ClusterEventPublisher
 from slurm_plugin.clustermgtd import ClusterManager
 from slurm_plugin.fleet_manager import EC2Instance
 from slurm_plugin.slurm_resources import DynamicNode, StaticNode
 
+# Level filter keeping every event published at INFO level or above
+_INFO_LEVELS = frozenset(("ERROR", "WARNING", "INFO"))
 
-def event_handler(received_events: List[Dict], level_filter: List[str] = None):
-    def _handler(level, message, event_type, *args, detail=None, **kwargs):
+
+class EventHandler:
+    """Event publisher collecting `{event_type: detail}` for every published event with a level in `level_filter`."""
+
+    __slots__ = ("_append", "_extend", "_level_filter")
+
+    def __init__(self, received_events: List[Dict], level_filter: Iterable[str] = None):
+        self._append = received_events.append
+        self._extend = received_events.extend
+        self._level_filter = frozenset(level_filter) if level_filter else None
+
+    def __call__(self, level, message, event_type, *args, detail=None, event_supplier=(), **kwargs):
         level = level if isinstance(level, str) else logging.getLevelName(level)
-        if not level_filter or level in level_filter:
-            if detail:
-                received_events.append({event_type: detail})
-            event_supplier = kwargs.get("event_supplier", [])
-            for event in event_supplier:
-                received_events.append({event_type: event.get("detail", None)})
+        if self._level_filter is not None and level not in self._level_filter:
+            return
+        if detail:
+            self._append({event_type: detail})
+        self._extend({event_type: event.get("detail", None)} for event in event_supplier)
+
+
+@pytest.fixture()
+def publisher_and_events():
+    """Return a factory creating a ClusterEventPublisher together with the list collecting its events."""
+
+    def _create(level_filter: Iterable[str] = None, **kwargs):
+        received_events = []
+        event_publisher = ClusterEventPublisher(EventHandler(received_events, level_filter=level_filter), **kwargs)
+        return event_publisher, received_events
+
+    return _create
 
-    return _handler
+
+def _empty_launch_failure_count(failure_type: str) -> Dict:
+    """Return the node-launch-failure-count event published for a failure type without failed nodes."""
+    return {"node-launch-failure-count": {"failure-type": failure_type, "count": 0, "error-details": {}}}
 
 
 @pytest.mark.parametrize(
@@ -253,11 +280,8 @@ def test_event_publisher(log_level, base_args, events, expected_events):
         publisher.publish_event(event[0], event[1], event[2], **event[3])
 
     # Assert calls
-    assert_that(received_events).is_length(len(expected_events))
-    for actual, expected in zip(received_events, expected_events):
-        assert_that(actual[0]).is_greater_than_or_equal_to(log_level)
-        actual_json = json.loads(actual[1])
-        assert_that(actual_json).is_equal_to(expected)
+    assert all(level >= log_level for level, _ in received_events)
+    assert [json.loads(value) for _, value in received_events] == expected_events
 
 
 @pytest.mark.parametrize(
@@ -527,12 +551,9 @@ def test_event_publisher_with_event_supplier(log_level, events, expected_events,
             b_setting="b-kwargs-setting",
         )
 
-    assert_that(events_supplied).is_equal_to(expected_supplied_count)
+    assert events_supplied == expected_supplied_count
 
-    assert_that(received_events).is_length(len(expected_events))
-    for actual, expected in zip(received_events, expected_events):
-        actual_json = json.loads(actual)
-        assert_that(actual_json).is_equal_to(expected)
+    assert [json.loads(value) for value in received_events] == expected_events
 
 
 def test_event_publisher_swallows_exceptions(caplog):
@@ -553,9 +574,51 @@ def test_event_publisher_swallows_exceptions(caplog):
 
     publisher.publish_event(logging.INFO, "hello", "event-type", detail={"hello": "goodbye"})
 
-    assert_that(handler_called).is_true()
+    assert handler_called
+
+    assert len(caplog.records) == 1
+
+
+# Static nodes shared by the parametrized cases of test_publish_unhealthy_static_node_events.
+# Tests assigning instances to these nodes must work on copies.
+_SAMPLE_STATIC_NODES = (
+    StaticNode("queue1-dy-c5xlarge-2", "ip-2", "hostname", "IDLE+CLOUD+POWERING_DOWN", "queue1"),
+    StaticNode("queue-dy-c5xlarge-1", "ip-3", "hostname", "IDLE+CLOUD", "queue"),
+    StaticNode("queue1-dy-c5xlarge-1", "ip-1", "hostname", "MIXED+CLOUD+NOT_RESPONDING+POWERING_UP", "queue1"),
+    StaticNode("queue1-dy-c4xlarge-1", "ip-1", "hostname", "DOWN", "queue1"),
+    StaticNode(
+        "queue1-dy-c5xlarge-3",
+        "nodeip",
+        "nodehostname",
+        "COMPLETING+DRAIN",
+        "queue1",
+        "(Code:InsufficientReservedInstanceCapacity)Failure when resuming nodes",
+    ),
+    StaticNode(
+        "queue2-dy-c5large-1",
+        "nodeip",
+        "nodehostname",
+        "DOWN+CLOUD",
+        "queue2",
+        "(Code:InsufficientHostCapacity)Failure when resuming nodes",
+    ),
+    StaticNode(
+        "queue2-dy-c5large-2",
+        "nodeip",
+        "nodehostname",
+        "DOWN+CLOUD",
+        "queue2",
+        "(Code:InsufficientHostCapacity)Error",
+    ),
+)
 
-    assert_that(caplog.records).is_length(1)
+# Backing instances assigned, by position, to the nodes of test_publish_unhealthy_static_node_events.
+# The largest case has 13 nodes; 16 leaves room for growth, raise it if a case needs more nodes.
+_MAX_STATIC_TEST_NODES = 16
+_SAMPLE_STATIC_INSTANCES = tuple(
+    EC2Instance(f"i-id-{instance_id}", f"1.2.3.{instance_id}", f"host-{instance_id}", "sometime")
+    for instance_id in range(_MAX_STATIC_TEST_NODES)
+)
 
 
 @pytest.mark.parametrize(
@@ -563,36 +626,7 @@ def test_event_publisher_swallows_exceptions(caplog):
     [
         (
             [
-                StaticNode("queue1-dy-c5xlarge-2", "ip-2", "hostname", "IDLE+CLOUD+POWERING_DOWN", "queue1"),
-                StaticNode("queue-dy-c5xlarge-1", "ip-3", "hostname", "IDLE+CLOUD", "queue"),
-                StaticNode(
-                    "queue1-dy-c5xlarge-1", "ip-1", "hostname", "MIXED+CLOUD+NOT_RESPONDING+POWERING_UP", "queue1"
-                ),
-                StaticNode("queue1-dy-c4xlarge-1", "ip-1", "hostname", "DOWN", "queue1"),
-                StaticNode(
-                    "queue1-dy-c5xlarge-3",
-                    "nodeip",
-                    "nodehostname",
-                    "COMPLETING+DRAIN",
-                    "queue1",
-                    "(Code:InsufficientReservedInstanceCapacity)Failure when resuming nodes",
-                ),
-                StaticNode(
-                    "queue2-dy-c5large-1",
-                    "nodeip",
-                    "nodehostname",
-                    "DOWN+CLOUD",
-                    "queue2",
-                    "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                ),
-                StaticNode(
-                    "queue2-dy-c5large-2",
-                    "nodeip",
-                    "nodehostname",
-                    "DOWN+CLOUD",
-                    "queue2",
-                    "(Code:InsufficientHostCapacity)Error",
-                ),
+                *_SAMPLE_STATIC_NODES,
                 StaticNode(
                     "queue2-dy-c5large-3",
                     "nodeip",
@@ -698,41 +732,12 @@ def test_event_publisher_swallows_exceptions(caplog):
                     }
                 },
             ],
-            ["ERROR", "WARNING", "INFO"],
+            _INFO_LEVELS,
             None,
         ),
         (
             [
-                StaticNode("queue1-dy-c5xlarge-2", "ip-2", "hostname", "IDLE+CLOUD+POWERING_DOWN", "queue1"),
-                StaticNode("queue-dy-c5xlarge-1", "ip-3", "hostname", "IDLE+CLOUD", "queue"),
-                StaticNode(
-                    "queue1-dy-c5xlarge-1", "ip-1", "hostname", "MIXED+CLOUD+NOT_RESPONDING+POWERING_UP", "queue1"
-                ),
-                StaticNode("queue1-dy-c4xlarge-1", "ip-1", "hostname", "DOWN", "queue1"),
-                StaticNode(
-                    "queue1-dy-c5xlarge-3",
-                    "nodeip",
-                    "nodehostname",
-                    "COMPLETING+DRAIN",
-                    "queue1",
-                    "(Code:InsufficientReservedInstanceCapacity)Failure when resuming nodes",
-                ),
-                StaticNode(
-                    "queue2-dy-c5large-1",
-                    "nodeip",
-                    "nodehostname",
-                    "DOWN+CLOUD",
-                    "queue2",
-                    "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                ),
-                StaticNode(
-                    "queue2-dy-c5large-2",
-                    "nodeip",
-                    "nodehostname",
-                    "DOWN+CLOUD",
-                    "queue2",
-                    "(Code:InsufficientHostCapacity)Error",
-                ),
+                *_SAMPLE_STATIC_NODES,
                 StaticNode(
                     "queue2-dy-c5large-10",
                     "nodeip",
@@ -776,7 +781,7 @@ def test_event_publisher_swallows_exceptions(caplog):
                     }
                 }
             ],
-            ["ERROR", "WARNING", "INFO"],
+            _INFO_LEVELS,
             2,
         ),
         (
@@ -798,9 +803,9 @@ def test_event_publisher_swallows_exceptions(caplog):
                 ),
             ],
             [
-                {"node-launch-failure-count": {"failure-type": "other-failures", "count": 0, "error-details": {}}},
-                {"node-launch-failure-count": {"failure-type": "ice-failures", "count": 0, "error-details": {}}},
-                {"node-launch-failure-count": {"failure-type": "vcpu-limit-failures", "count": 0, "error-details": {}}},
+                _empty_launch_failure_count("other-failures"),
+                _empty_launch_failure_count("ice-failures"),
+                _empty_launch_failure_count("vcpu-limit-failures"),
                 {
                     "node-launch-failure-count": {
                         "failure-type": "volume-limit-failures",
@@ -810,7 +815,7 @@ def test_event_publisher_swallows_exceptions(caplog):
                         },
                     }
                 },
-                {"node-launch-failure-count": {"failure-type": "iam-policy-errors", "count": 0, "error-details": {}}},
+                _empty_launch_failure_count("iam-policy-errors"),
                 {
                     "node-launch-failure": {
                         "node": {
@@ -929,35 +934,28 @@ def test_event_publisher_swallows_exceptions(caplog):
     ],
     ids=["default list limit", "list limit of 2", "debug output"],
 )
-def test_publish_unhealthy_static_node_events(test_nodes, expected_details, level_filter, max_list_size):
-    received_events = []
+def test_publish_unhealthy_static_node_events(
+    test_nodes, expected_details, level_filter, max_list_size, publisher_and_events
+):
     if max_list_size:
-        event_publisher = ClusterEventPublisher(
-            event_handler(received_events, level_filter=level_filter), max_list_size=max_list_size
-        )
+        event_publisher, received_events = publisher_and_events(level_filter, max_list_size=max_list_size)
     else:
-        event_publisher = ClusterEventPublisher(event_handler(received_events, level_filter=level_filter))
+        event_publisher, received_events = publisher_and_events(level_filter)
 
-    instances = [
-        EC2Instance(f"i-id-{instance_id}", f"1.2.3.{instance_id}", f"host-{instance_id}", "sometime")
-        for instance_id in range(len(test_nodes))
-    ]
-
-    nodes_and_instances = zip(test_nodes, instances)
-
-    for node, instance in nodes_and_instances:
-        node.instance = instance
-
-    # Make sure non-lists work
-    nodes_in_replacement = (node.name for node in test_nodes)
-    failed_nodes = {}
+    assert len(test_nodes) <= _MAX_STATIC_TEST_NODES, "raise _MAX_STATIC_TEST_NODES to cover every node of the case"
+    test_nodes = [copy.copy(node) for node in test_nodes]
+    failed_nodes = collections.defaultdict(list)
     launched_nodes = []
-    for node in test_nodes:
+    for instance_id, node in enumerate(test_nodes):
+        node.instance = _SAMPLE_STATIC_INSTANCES[instance_id]
         if node.error_code:
-            failed_nodes.setdefault(node.error_code, []).append(node.name)
+            failed_nodes[node.error_code].append(node.name)
         else:
             launched_nodes.append(node.name)
 
+    # Make sure non-lists work
+    nodes_in_replacement = (node.name for node in test_nodes)
+
     # Run test
     event_publisher.publish_unhealthy_static_node_events(
         test_nodes,
@@ -967,9 +965,7 @@ def test_publish_unhealthy_static_node_events(test_nodes, expected_details, leve
     )
 
     # Assert calls
-    assert_that(received_events).is_length(len(expected_details))
-    for received_event, expected_detail in zip(received_events, expected_details):
-        assert_that(received_event).is_equal_to(expected_detail)
+    assert received_events == expected_details
 
 
 @pytest.mark.parametrize(
@@ -990,13 +986,13 @@ def test_publish_unhealthy_static_node_events(test_nodes, expected_details, leve
                     }
                 }
             ],
-            ["ERROR", "WARNING", "INFO"],
+            _INFO_LEVELS,
         ),
         (
             ClusterManager.HealthCheckTypes.ec2_health,
             [],
             [],
-            ["ERROR", "WARNING", "INFO"],
+            _INFO_LEVELS,
         ),
         (
             ClusterManager.HealthCheckTypes.ec2_health,
@@ -1011,17 +1007,55 @@ def test_publish_unhealthy_static_node_events(test_nodes, expected_details, leve
         "no-failures-debug",
     ],
 )
-def test_publish_nodes_failing_health_check_events(health_check_type, failed_nodes, expected_details, level_filter):
-    received_events = []
-    event_publisher = ClusterEventPublisher(event_handler(received_events, level_filter=level_filter))
+def test_publish_nodes_failing_health_check_events(
+    health_check_type, failed_nodes, expected_details, level_filter, publisher_and_events
+):
+    event_publisher, received_events = publisher_and_events(level_filter)
 
     # Run test
     event_publisher.publish_nodes_failing_health_check_events(health_check_type, failed_nodes)
 
     # Assert calls
-    assert_that(received_events).is_length(len(expected_details))
-    for received_event, expected_detail in zip(received_events, expected_details):
-        assert_that(received_event).is_equal_to(expected_detail)
+    assert received_events == expected_details
+
+
+# Nodes, and whether their backing instance is invalid, shared by the parametrized cases of
+# test_publish_unhealthy_node_events. The test sets the address of these nodes, so it must work on copies.
+_SAMPLE_UNHEALTHY_NODES = (
+    (
+        StaticNode(
+            "queue2-dy-c5large-1",
+            "nodeip",
+            "nodehostname",
+            "DOWN+CLOUD",
+            "queue2",
+            "(Code:InsufficientHostCapacity)Failure when resuming nodes",
+        ),
+        False,
+    ),
+    (
+        StaticNode(
+            "queue2-dy-c5large-2",
+            "nodeip",
+            "nodehostname",
+            "DOWN+CLOUD",
+            "queue2",
+            "(Code:InsufficientHostCapacity)Failure when resuming nodes",
+        ),
+        False,
+    ),
+    (
+        StaticNode(
+            "queue2-dy-c5large-3",
+            "",
+            "nodehostname",
+            "DOWN+CLOUD",
+            "queue2",
+            "(Code:InsufficientHostCapacity)Failure when resuming nodes",
+        ),
+        False,
+    ),
+)
 
 
 @pytest.mark.parametrize(
@@ -1100,83 +1134,15 @@ def test_publish_nodes_failing_health_check_events(health_check_type, failed_nod
                 {"invalid-backing-instance-count": {"count": 1, "nodes": [{"name": "queue2-dy-c5large-2"}]}},
                 {"node-not-responding-down-count": {"count": 1, "nodes": [{"name": "queue2-dy-c5large-4"}]}},
             ],
-            ["ERROR", "WARNING", "INFO"],
+            _INFO_LEVELS,
         ),
         (
-            [
-                (
-                    StaticNode(
-                        "queue2-dy-c5large-1",
-                        "nodeip",
-                        "nodehostname",
-                        "DOWN+CLOUD",
-                        "queue2",
-                        "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                    ),
-                    False,
-                ),
-                (
-                    StaticNode(
-                        "queue2-dy-c5large-2",
-                        "nodeip",
-                        "nodehostname",
-                        "DOWN+CLOUD",
-                        "queue2",
-                        "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                    ),
-                    False,
-                ),
-                (
-                    StaticNode(
-                        "queue2-dy-c5large-3",
-                        "",
-                        "nodehostname",
-                        "DOWN+CLOUD",
-                        "queue2",
-                        "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                    ),
-                    False,
-                ),
-            ],
+            list(_SAMPLE_UNHEALTHY_NODES),
             [],
-            ["ERROR", "WARNING", "INFO"],
+            _INFO_LEVELS,
         ),
         (
-            [
-                (
-                    StaticNode(
-                        "queue2-dy-c5large-1",
-                        "nodeip",
-                        "nodehostname",
-                        "DOWN+CLOUD",
-                        "queue2",
-                        "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                    ),
-                    False,
-                ),
-                (
-                    StaticNode(
-                        "queue2-dy-c5large-2",
-                        "nodeip",
-                        "nodehostname",
-                        "DOWN+CLOUD",
-                        "queue2",
-                        "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                    ),
-                    False,
-                ),
-                (
-                    StaticNode(
-                        "queue2-dy-c5large-3",
-                        "",
-                        "nodehostname",
-                        "DOWN+CLOUD",
-                        "queue2",
-                        "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                    ),
-                    False,
-                ),
-            ],
+            list(_SAMPLE_UNHEALTHY_NODES),
             [
                 {"invalid-backing-instance-count": {"count": 0, "nodes": []}},
                 {"node-not-responding-down-count": {"count": 0, "nodes": []}},
@@ -1246,12 +1212,12 @@ def test_publish_nodes_failing_health_check_events(health_check_type, failed_nod
     ],
     ids=["has invalid backing instances", "no invalid backing instances", "debug output"],
 )
-def test_publish_unhealthy_node_events(failed_nodes, expected_details, level_filter):
-    received_events = []
-    event_publisher = ClusterEventPublisher(event_handler(received_events, level_filter=level_filter))
+def test_publish_unhealthy_node_events(failed_nodes, expected_details, level_filter, publisher_and_events):
+    event_publisher, received_events = publisher_and_events(level_filter)
 
     bad_nodes = []
     for node, invalid_backing_instance in failed_nodes:
+        node = copy.copy(node)
         if not invalid_backing_instance:
             node.nodeaddr = node.name
         bad_nodes.append(node)
@@ -1260,9 +1226,37 @@ def test_publish_unhealthy_node_events(failed_nodes, expected_details, level_fil
     event_publisher.publish_unhealthy_node_events(bad_nodes)
 
     # Assert calls
-    assert_that(received_events).is_length(len(expected_details))
-    for received_event, expected_detail in zip(received_events, expected_details):
-        assert_that(received_event).is_equal_to(expected_detail)
+    assert received_events == expected_details
+
+
+# Nodes shared by the parametrized cases of test_publish_bootstrap_failure_events.
+# The test patches is_bootstrap_timeout on these nodes, so it must work on copies.
+_SAMPLE_BOOTSTRAP_FAILURE_NODES = (
+    StaticNode(
+        "queue2-st-c5large-2",
+        "nodeip",
+        "nodehostname",
+        "DOWN+CLOUD",
+        "queue2",
+        "(Code:InsufficientHostCapacity)Failure when resuming nodes",
+    ),
+    StaticNode(
+        "queue2-st-c5large-3",
+        "nodeip",
+        "nodehostname",
+        "DOWN+CLOUD",
+        "queue2",
+        "(Code:InsufficientHostCapacity)Failure when resuming nodes",
+    ),
+    DynamicNode(
+        "queue2-dy-c5large-4",
+        "nodeip",
+        "nodehostname",
+        "DOWN+CLOUD",
+        "queue2",
+        "(Code:InsufficientHostCapacity)Failure when resuming nodes",
+    ),
+)
 
 
 @pytest.mark.parametrize(
@@ -1278,30 +1272,7 @@ def test_publish_unhealthy_node_events(failed_nodes, expected_details, level_fil
                     "queue2",
                     "(Code:InsufficientHostCapacity)Failure when resuming nodes",
                 ),
-                StaticNode(
-                    "queue2-st-c5large-2",
-                    "nodeip",
-                    "nodehostname",
-                    "DOWN+CLOUD",
-                    "queue2",
-                    "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                ),
-                StaticNode(
-                    "queue2-st-c5large-3",
-                    "nodeip",
-                    "nodehostname",
-                    "DOWN+CLOUD",
-                    "queue2",
-                    "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                ),
-                DynamicNode(
-                    "queue2-dy-c5large-4",
-                    "nodeip",
-                    "nodehostname",
-                    "DOWN+CLOUD",
-                    "queue2",
-                    "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                ),
+                *_SAMPLE_BOOTSTRAP_FAILURE_NODES,
             ],
             [True, True, False, False],
             [
@@ -1327,7 +1298,7 @@ def test_publish_unhealthy_node_events(failed_nodes, expected_details, level_fil
                     }
                 },
             ],
-            ["ERROR", "WARNING", "INFO"],
+            _INFO_LEVELS,
         ),
         (
             [
@@ -1339,30 +1310,7 @@ def test_publish_unhealthy_node_events(failed_nodes, expected_details, level_fil
                     "queue2",
                     "(Code:InsufficientHostCapacity)Failure when resuming nodes",
                 ),
-                StaticNode(
-                    "queue2-st-c5large-2",
-                    "nodeip",
-                    "nodehostname",
-                    "DOWN+CLOUD",
-                    "queue2",
-                    "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                ),
-                StaticNode(
-                    "queue2-st-c5large-3",
-                    "nodeip",
-                    "nodehostname",
-                    "DOWN+CLOUD",
-                    "queue2",
-                    "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                ),
-                DynamicNode(
-                    "queue2-dy-c5large-4",
-                    "nodeip",
-                    "nodehostname",
-                    "DOWN+CLOUD",
-                    "queue2",
-                    "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                ),
+                *_SAMPLE_BOOTSTRAP_FAILURE_NODES,
             ],
             [False, False, False, False],
             [
@@ -1379,16 +1327,15 @@ def test_publish_unhealthy_node_events(failed_nodes, expected_details, level_fil
                     }
                 }
             ],
-            ["ERROR", "WARNING", "INFO"],
+            _INFO_LEVELS,
         ),
         (
             [],
             [],
             [],
-            ["ERROR", "WARNING", "INFO"],
+            _INFO_LEVELS,
         ),
         (
-            [],
             [],
             [],
             [
@@ -1408,17 +1355,20 @@ def test_publish_unhealthy_node_events(failed_nodes, expected_details, level_fil
                 },
                 {"protected-mode-error-count": {"failure-type": "other-bootstrap-error", "count": 0, "nodes": []}},
             ],
+            [],
         ),
     ],
     ids=["With protected mode errors", "No protected mode errors", "No Errors", "No Errors debug output"],
 )
-def test_publish_bootstrap_failure_events(failed_nodes, replacement_timeouts, expected_details, level_filter):
-    received_events = []
-    event_publisher = ClusterEventPublisher(event_handler(received_events, level_filter=level_filter))
+def test_publish_bootstrap_failure_events(
+    failed_nodes, replacement_timeouts, expected_details, level_filter, publisher_and_events
+):
+    event_publisher, received_events = publisher_and_events(level_filter)
 
     def define_bootstrap_timeout(is_failure):
         return lambda *args: is_failure
 
+    failed_nodes = [copy.copy(node) for node in failed_nodes]
     for node, is_timeout in zip(failed_nodes, replacement_timeouts):
         node.is_bootstrap_timeout = define_bootstrap_timeout(is_timeout)
 
@@ -1426,169 +1376,149 @@ def test_publish_bootstrap_failure_events(failed_nodes, replacement_timeouts, ex
     event_publisher.publish_bootstrap_failure_events(failed_nodes)
 
     # Assert calls
-    assert_that(received_events).is_length(len(expected_details))
-    for received_event, expected_detail in zip(received_events, expected_details):
-        assert_that(received_event).is_equal_to(expected_detail)
+    assert received_events == expected_details
+
+
+# Nodes that failed to launch, by error code, in the all-errors case of test_publish_node_launch_events
+_SAMPLE_FAILED_LAUNCH_NODES = {
+    "Error1": [
+        "node-a-1",
+        "node-a-2",
+        "node-a-3",
+    ],
+    "Error2": [
+        "node-b-1",
+        "node-b-2",
+    ],
+    "InsufficientInstanceCapacity": [
+        "ice-a-1",
+        "ice-a-2",
+        "ice-a-3",
+    ],
+    "InsufficientHostCapacity": [
+        "ice-b-1",
+        "ice-b-2",
+    ],
+    "LimitedInstanceCapacity": [
+        "ice-g-1",
+        "ice-g-2",
+    ],
+    "InsufficientReservedInstanceCapacity": [
+        "ice-c-1",
+        "ice-c-2",
+        "ice-c-3",
+    ],
+    "MaxSpotInstanceCountExceeded": [
+        "ice-d-1",
+        "ice-d-2",
+    ],
+    "Unsupported": [
+        "ice-e-1",
+        "ice-e-2",
+        "ice-e-3",
+    ],
+    "SpotMaxPriceTooLow": [
+        "ice-f-1",
+        "ice-f-2",
+    ],
+    "VcpuLimitExceeded": [
+        "vcpu-g-1",
+    ],
+    "VolumeLimitExceeded": [
+        "vle-h-1",
+        "vle-h-2",
+    ],
+    "InsufficientVolumeCapacity": [
+        "ivc-i-1",
+        "ivc-i-2",
+        "ivc-i-3",
+    ],
+    "InvalidBlockDeviceMapping": [
+        "ibdm-j-1",
+        "ibdm-j-2",
+        "ibdm-j-3",
+    ],
+    "UnauthorizedOperation": [
+        "iam-k-1",
+        "iam-k-2",
+    ],
+    "AccessDeniedException": [
+        "iam-l-1",
+    ],
+}
+
+
+def _launch_failure_error_details(*error_codes: str) -> Dict:
+    """Return the error-details published for the given error codes of _SAMPLE_FAILED_LAUNCH_NODES."""
+    return {
+        error_code: {
+            "count": len(_SAMPLE_FAILED_LAUNCH_NODES[error_code]),
+            "nodes": [{"name": node_name} for node_name in _SAMPLE_FAILED_LAUNCH_NODES[error_code]],
+        }
+        for error_code in error_codes
+    }
 
 
 @pytest.mark.parametrize(
     "failed_nodes, expected_details, level_filter",
     [
         (
-            {
-                "Error1": [
-                    "node-a-1",
-                    "node-a-2",
-                    "node-a-3",
-                ],
-                "Error2": [
-                    "node-b-1",
-                    "node-b-2",
-                ],
-                "InsufficientInstanceCapacity": [
-                    "ice-a-1",
-                    "ice-a-2",
-                    "ice-a-3",
-                ],
-                "InsufficientHostCapacity": [
-                    "ice-b-1",
-                    "ice-b-2",
-                ],
-                "LimitedInstanceCapacity": [
-                    "ice-g-1",
-                    "ice-g-2",
-                ],
-                "InsufficientReservedInstanceCapacity": [
-                    "ice-c-1",
-                    "ice-c-2",
-                    "ice-c-3",
-                ],
-                "MaxSpotInstanceCountExceeded": [
-                    "ice-d-1",
-                    "ice-d-2",
-                ],
-                "Unsupported": [
-                    "ice-e-1",
-                    "ice-e-2",
-                    "ice-e-3",
-                ],
-                "SpotMaxPriceTooLow": [
-                    "ice-f-1",
-                    "ice-f-2",
-                ],
-                "VcpuLimitExceeded": [
-                    "vcpu-g-1",
-                ],
-                "VolumeLimitExceeded": [
-                    "vle-h-1",
-                    "vle-h-2",
-                ],
-                "InsufficientVolumeCapacity": [
-                    "ivc-i-1",
-                    "ivc-i-2",
-                    "ivc-i-3",
-                ],
-                "InvalidBlockDeviceMapping": [
-                    "ibdm-j-1",
-                    "ibdm-j-2",
-                    "ibdm-j-3",
-                ],
-                "UnauthorizedOperation": [
-                    "iam-k-1",
-                    "iam-k-2",
-                ],
-                "AccessDeniedException": [
-                    "iam-l-1",
-                ],
-            },
+            _SAMPLE_FAILED_LAUNCH_NODES,
             [
                 {
                     "node-launch-failure-count": {
                         "failure-type": "other-failures",
                         "count": 9,
-                        "error-details": {
-                            "Error1": {
-                                "count": 3,
-                                "nodes": [{"name": "node-a-1"}, {"name": "node-a-2"}, {"name": "node-a-3"}],
-                            },
-                            "Error2": {"count": 2, "nodes": [{"name": "node-b-1"}, {"name": "node-b-2"}]},
-                            "InvalidBlockDeviceMapping": {
-                                "count": 3,
-                                "nodes": [{"name": "ibdm-j-1"}, {"name": "ibdm-j-2"}, {"name": "ibdm-j-3"}],
-                            },
-                            "AccessDeniedException": {"count": 1, "nodes": [{"name": "iam-l-1"}]},
-                        },
+                        "error-details": _launch_failure_error_details(
+                            "Error1", "Error2", "InvalidBlockDeviceMapping", "AccessDeniedException"
+                        ),
                     }
                 },
                 {
                     "node-launch-failure-count": {
                         "failure-type": "ice-failures",
                         "count": 17,
-                        "error-details": {
-                            "InsufficientInstanceCapacity": {
-                                "count": 3,
-                                "nodes": [{"name": "ice-a-1"}, {"name": "ice-a-2"}, {"name": "ice-a-3"}],
-                            },
-                            "InsufficientHostCapacity": {
-                                "count": 2,
-                                "nodes": [{"name": "ice-b-1"}, {"name": "ice-b-2"}],
-                            },
-                            "LimitedInstanceCapacity": {
-                                "count": 2,
-                                "nodes": [{"name": "ice-g-1"}, {"name": "ice-g-2"}],
-                            },
-                            "InsufficientReservedInstanceCapacity": {
-                                "count": 3,
-                                "nodes": [{"name": "ice-c-1"}, {"name": "ice-c-2"}, {"name": "ice-c-3"}],
-                            },
-                            "MaxSpotInstanceCountExceeded": {
-                                "count": 2,
-                                "nodes": [{"name": "ice-d-1"}, {"name": "ice-d-2"}],
-                            },
-                            "Unsupported": {
-                                "count": 3,
-                                "nodes": [{"name": "ice-e-1"}, {"name": "ice-e-2"}, {"name": "ice-e-3"}],
-                            },
-                            "SpotMaxPriceTooLow": {"count": 2, "nodes": [{"name": "ice-f-1"}, {"name": "ice-f-2"}]},
-                        },
+                        "error-details": _launch_failure_error_details(
+                            "InsufficientInstanceCapacity",
+                            "InsufficientHostCapacity",
+                            "LimitedInstanceCapacity",
+                            "InsufficientReservedInstanceCapacity",
+                            "MaxSpotInstanceCountExceeded",
+                            "Unsupported",
+                            "SpotMaxPriceTooLow",
+                        ),
                     }
                 },
                 {
                     "node-launch-failure-count": {
                         "failure-type": "vcpu-limit-failures",
                         "count": 1,
-                        "error-details": {"VcpuLimitExceeded": {"count": 1, "nodes": [{"name": "vcpu-g-1"}]}},
+                        "error-details": _launch_failure_error_details("VcpuLimitExceeded"),
                     }
                 },
                 {
                     "node-launch-failure-count": {
                         "failure-type": "volume-limit-failures",
                         "count": 5,
-                        "error-details": {
-                            "VolumeLimitExceeded": {"count": 2, "nodes": [{"name": "vle-h-1"}, {"name": "vle-h-2"}]},
-                            "InsufficientVolumeCapacity": {
-                                "count": 3,
-                                "nodes": [{"name": "ivc-i-1"}, {"name": "ivc-i-2"}, {"name": "ivc-i-3"}],
-                            },
-                        },
+                        "error-details": _launch_failure_error_details(
+                            "VolumeLimitExceeded", "InsufficientVolumeCapacity"
+                        ),
                     }
                 },
                 {
                     "node-launch-failure-count": {
                         "failure-type": "iam-policy-errors",
                         "count": 2,
-                        "error-details": {
-                            "UnauthorizedOperation": {"count": 2, "nodes": [{"name": "iam-k-1"}, {"name": "iam-k-2"}]}
-                        },
+                        "error-details": _launch_failure_error_details("UnauthorizedOperation"),
                     }
                 },
             ],
-            ["ERROR", "WARNING", "INFO"],
+            _INFO_LEVELS,
         ),
         (
             {},
             [],
-            ["ERROR", "WARNING", "INFO"],
+            _INFO_LEVELS,
         ),
         (
             {
@@ -1597,7 +1527,7 @@ def test_publish_bootstrap_failure_events(failed_nodes, replacement_timeouts, ex
                 ],
             },
             [
-                {"node-launch-failure-count": {"failure-type": "other-failures", "count": 0, "error-details": {}}},
+                _empty_launch_failure_count("other-failures"),
                 {
                     "node-launch-failure-count": {
                         "failure-type": "ice-failures",
@@ -1605,15 +1535,9 @@ def test_publish_bootstrap_failure_events(failed_nodes, replacement_timeouts, ex
                         "error-details": {"LimitedInstanceCapacity": {"count": 1, "nodes": [{"name": "ice-g-1"}]}},
                     }
                 },
-                {"node-launch-failure-count": {"failure-type": "vcpu-limit-failures", "count": 0, "error-details": {}}},
-                {
-                    "node-launch-failure-count": {
-                        "failure-type": "volume-limit-failures",
-                        "count": 0,
-                        "error-details": {},
-                    }
-                },
-                {"node-launch-failure-count": {"failure-type": "iam-policy-errors", "count": 0, "error-details": {}}},
+                _empty_launch_failure_count("vcpu-limit-failures"),
+                _empty_launch_failure_count("volume-limit-failures"),
+                _empty_launch_failure_count("iam-policy-errors"),
                 {
                     "node-launch-failure": {
                         "error-code": "LimitedInstanceCapacity",
@@ -1631,21 +1555,153 @@ def test_publish_bootstrap_failure_events(failed_nodes, replacement_timeouts, ex
         "debug-level",
     ],
 )
-def test_publish_node_launch_events(failed_nodes, expected_details, level_filter):
-    received_events = []
-    event_publisher = ClusterEventPublisher(event_handler(received_events, level_filter=level_filter))
+def test_publish_node_launch_events(failed_nodes, expected_details, level_filter, publisher_and_events):
+    event_publisher, received_events = publisher_and_events(level_filter)
 
     # Run test
     event_publisher.publish_node_launch_events(failed_nodes)
 
     # Assert calls
-    assert_that(received_events).is_length(len(expected_details))
-    for received_event, expected_detail in zip(received_events, expected_details):
-        assert_that(received_event).is_equal_to(expected_detail)
+    assert received_events == expected_details
+
+
+# Backing instances of the compute nodes of test_publish_compute_node_events, by instance number
+_SAMPLE_COMPUTE_INSTANCES = {
+    instance_number: EC2Instance(
+        id=f"id-{instance_number}",
+        private_ip=f"ip-{instance_number}",
+        hostname="hostname",
+        launch_time="some_launch_time",
+    )
+    for instance_number in range(1, 13)
+}
+
+# Compute nodes shared by the parametrized cases of test_publish_compute_node_events, which only reads them
+_SAMPLE_COMPUTE_NODES = (
+    StaticNode(
+        "queue1-st-c5xlarge-2",
+        "ip-2",
+        "hostname",
+        "IDLE+CLOUD+POWERING_DOWN",
+        "queue1",
+        instance=_SAMPLE_COMPUTE_INSTANCES[1],
+    ),
+    StaticNode(
+        "queue-st-c5xlarge-1",
+        "ip-3",
+        "hostname",
+        "IDLE+CLOUD",
+        "queue",
+        instance=_SAMPLE_COMPUTE_INSTANCES[2],
+    ),
+    DynamicNode(
+        "queue1-dy-c5xlarge-1",
+        "ip-1",
+        "hostname",
+        "MIXED+CLOUD+NOT_RESPONDING+POWERING_UP",
+        "queue1",
+        instance=_SAMPLE_COMPUTE_INSTANCES[2],
+    ),
+    StaticNode(
+        "queue1-st-c4xlarge-1",
+        "ip-1",
+        "hostname",
+        "DOWN",
+        "queue1",
+        instance=_SAMPLE_COMPUTE_INSTANCES[3],
+    ),
+    DynamicNode(
+        "queue1-dy-c5xlarge-3",
+        "nodeip",
+        "nodehostname",
+        "IDLE+CLOUD+POWERING_UP",
+        "queue1",
+        "(Code:InsufficientReservedInstanceCapacity)Failure when resuming nodes",
+        lastbusytime=datetime(year=2023, month=3, day=10, hour=11, minute=24, second=14, tzinfo=timezone.utc),
+        instance=_SAMPLE_COMPUTE_INSTANCES[4],
+    ),
+    DynamicNode(
+        "queue2-dy-c5large-1",
+        "nodeip",
+        "nodehostname",
+        "IDLE+CLOUD",
+        "queue2",
+        "(Code:InsufficientHostCapacity)Failure when resuming nodes",
+        instance=_SAMPLE_COMPUTE_INSTANCES[5],
+    ),
+    DynamicNode(
+        "queue2-dy-c5large-2",
+        "nodeip",
+        "nodehostname",
+        "IDLE+CLOUD+POWERING_DOWN",
+        "queue2",
+        "(Code:InsufficientHostCapacity)Error",
+        lastbusytime=datetime(year=2023, month=3, day=10, hour=12, minute=23, second=14, tzinfo=timezone.utc),
+        instance=_SAMPLE_COMPUTE_INSTANCES[6],
+    ),
+    StaticNode(
+        "queue2-st-c5large-3",
+        "nodeip",
+        "nodehostname",
+        "IDLE+CLOUD",
+        "queue2",
+        "(Code:UnauthorizedOperation)Error",
+        lastbusytime=datetime(year=2023, month=3, day=10, hour=11, minute=23, second=10, tzinfo=timezone.utc),
+        instance=_SAMPLE_COMPUTE_INSTANCES[7],
+    ),
+    StaticNode(
+        "queue2-st-c5large-4",
+        "nodeip",
+        "nodehostname",
+        "MIXED+CLOUD+POWERED_UP",
+        "queue2",
+        "(Code:InvalidBlockDeviceMapping)Error",
+        lastbusytime=datetime(year=2023, month=3, day=10, hour=21, minute=23, second=14, tzinfo=timezone.utc),
+        instance=_SAMPLE_COMPUTE_INSTANCES[8],
+    ),
+    DynamicNode(
+        "queue2-dy-c5large-5",
+        "nodeip",
+        "nodehostname",
+        "DOWN+CLOUD",
+        "queue2",
+        "(Code:AccessDeniedException)Error",
+        instance=_SAMPLE_COMPUTE_INSTANCES[9],
+    ),
+    StaticNode(
+        "queue2-st-c5large-6",
+        "nodeip",
+        "nodehostname",
+        "IDLE+CLOUD+POWERED_UP",
+        "queue2",
+        "(Code:VcpuLimitExceeded)Error",
+        lastbusytime=datetime(year=2023, month=3, day=10, hour=11, minute=25, second=14, tzinfo=timezone.utc),
+        instance=_SAMPLE_COMPUTE_INSTANCES[10],
+    ),
+    StaticNode(
+        "queue2-st-c5large-8",
+        "nodeip",
+        "nodehostname",
+        "DOWN+CLOUD",
+        "queue2",
+        "(Code:VolumeLimitExceeded)Error",
+        instance=_SAMPLE_COMPUTE_INSTANCES[11],
+    ),
+    DynamicNode(
+        "queue2-dy-c5large-9",
+        "nodeip",
+        "nodehostname",
+        "IDLE+CLOUD",
+        "queue2",
+        "(Code:InsufficientVolumeCapacity)Error",
+        lastbusytime=datetime(year=2023, month=3, day=11, hour=11, minute=23, second=14, tzinfo=timezone.utc),
+        instance=_SAMPLE_COMPUTE_INSTANCES[12],
+    ),
+)
 
 
 @pytest.mark.parametrize(
-    "compute_nodes, expected_details, level_filter, max_list_size",
+    "compute_nodes, level_filter, max_list_size",
     [
         (
             [
@@ -1662,9 +1718,7 @@ def test_publish_node_launch_events(failed_nodes, expected_details, level_filter
                     "MIXED+CLOUD+POWERING_UP",
                     "queue1",
                     "(Code:InsufficientReservedInstanceCapacity)Failure when resuming nodes",
-                    instance=EC2Instance(
-                        id="id-1", private_ip="ip-1", hostname="hostname", launch_time="some_launch_time"
-                    ),
+                    instance=_SAMPLE_COMPUTE_INSTANCES[1],
                 ),
                 DynamicNode(
                     "queue2-dy-c5large-1",
@@ -1692,9 +1746,7 @@ def test_publish_node_launch_events(failed_nodes, expected_details, level_filter
                     "IDLE+CLOUD",
                     "queue2",
                     "(Code:UnauthorizedOperation)Error",
-                    instance=EC2Instance(
-                        id="id-2", private_ip="ip-2", hostname="hostname", launch_time="some_launch_time"
-                    ),
+                    instance=_SAMPLE_COMPUTE_INSTANCES[2],
                 ),
                 StaticNode(
                     "queue2-st-c5large-4",
@@ -1743,942 +1795,21 @@ def test_publish_node_launch_events(failed_nodes, expected_details, level_filter
                     ),
                 ),
             ],
-            [
-                {"compute-node-state-count": {"node-state": "IDLE+CLOUD+POWERING_DOWN", "count": 1}},
-                {"compute-node-state-count": {"node-state": "IDLE+CLOUD", "count": 3}},
-                {"compute-node-state-count": {"node-state": "MIXED+CLOUD+NOT_RESPONDING+POWERING_UP", "count": 1}},
-                {"compute-node-state-count": {"node-state": "DOWN", "count": 1}},
-                {"compute-node-state-count": {"node-state": "MIXED+CLOUD+POWERING_UP", "count": 1}},
-                {"compute-node-state-count": {"node-state": "MIXED+CLOUD+POWERING_DOWN", "count": 1}},
-                {"compute-node-state-count": {"node-state": "MIXED+CLOUD+POWERED_UP", "count": 1}},
-                {"compute-node-state-count": {"node-state": "DOWN+CLOUD", "count": 2}},
-                {"compute-node-state-count": {"node-state": "IDLE+CLOUD+POWERED_UP", "count": 1}},
-                {"compute-node-state-count": {"node-state": "DOWN+CLOUD+NOT_RESPONDING", "count": 1}},
-                {"cluster-instance-count": {"count": 2}},
-            ],
-            ["ERROR", "WARNING", "INFO"],
+            _INFO_LEVELS,
             None,
         ),
         (
-            [
-                StaticNode(
-                    "queue1-st-c5xlarge-2",
-                    "ip-2",
-                    "hostname",
-                    "IDLE+CLOUD+POWERING_DOWN",
-                    "queue1",
-                    instance=EC2Instance(
-                        id="id-1", private_ip="ip-1", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue-st-c5xlarge-1",
-                    "ip-3",
-                    "hostname",
-                    "IDLE+CLOUD",
-                    "queue",
-                    instance=EC2Instance(
-                        id="id-2", private_ip="ip-2", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue1-dy-c5xlarge-1",
-                    "ip-1",
-                    "hostname",
-                    "MIXED+CLOUD+NOT_RESPONDING+POWERING_UP",
-                    "queue1",
-                    instance=EC2Instance(
-                        id="id-2", private_ip="ip-2", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue1-st-c4xlarge-1",
-                    "ip-1",
-                    "hostname",
-                    "DOWN",
-                    "queue1",
-                    instance=EC2Instance(
-                        id="id-3", private_ip="ip-3", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue1-dy-c5xlarge-3",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD+POWERING_UP",
-                    "queue1",
-                    "(Code:InsufficientReservedInstanceCapacity)Failure when resuming nodes",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=10, hour=11, minute=24, second=14, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-4", private_ip="ip-4", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue2-dy-c5large-1",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD",
-                    "queue2",
-                    "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                    instance=EC2Instance(
-                        id="id-5", private_ip="ip-5", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue2-dy-c5large-2",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD+POWERING_DOWN",
-                    "queue2",
-                    "(Code:InsufficientHostCapacity)Error",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=10, hour=12, minute=23, second=14, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-6", private_ip="ip-6", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue2-st-c5large-3",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD",
-                    "queue2",
-                    "(Code:UnauthorizedOperation)Error",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=10, hour=11, minute=23, second=10, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-7", private_ip="ip-7", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue2-st-c5large-4",
-                    "nodeip",
-                    "nodehostname",
-                    "MIXED+CLOUD+POWERED_UP",
-                    "queue2",
-                    "(Code:InvalidBlockDeviceMapping)Error",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=10, hour=21, minute=23, second=14, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-8", private_ip="ip-8", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue2-dy-c5large-5",
-                    "nodeip",
-                    "nodehostname",
-                    "DOWN+CLOUD",
-                    "queue2",
-                    "(Code:AccessDeniedException)Error",
-                    instance=EC2Instance(
-                        id="id-9", private_ip="ip-9", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue2-st-c5large-6",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD+POWERED_UP",
-                    "queue2",
-                    "(Code:VcpuLimitExceeded)Error",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=10, hour=11, minute=25, second=14, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-10", private_ip="ip-10", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue2-st-c5large-8",
-                    "nodeip",
-                    "nodehostname",
-                    "DOWN+CLOUD",
-                    "queue2",
-                    "(Code:VolumeLimitExceeded)Error",
-                    instance=EC2Instance(
-                        id="id-11", private_ip="ip-11", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue2-dy-c5large-9",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD",
-                    "queue2",
-                    "(Code:InsufficientVolumeCapacity)Error",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=11, hour=11, minute=23, second=14, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-12", private_ip="ip-12", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-            ],
-            [
-                {
-                    "compute-node-idle-time": {
-                        "node-type": "dynamic",
-                        "longest-idle-time": 129540.0,
-                        "longest-idle-node": {
-                            "name": "queue1-dy-c5xlarge-3",
-                            "type": "dynamic",
-                            "address": "nodeip",
-                            "hostname": "nodehostname",
-                            "state-string": "IDLE+CLOUD+POWERING_UP",
-                            "state-reason": "(Code:InsufficientReservedInstanceCapacity)Failure when resuming nodes",
-                            "state": "IDLE",
-                            "state-flags": ["CLOUD", "POWERING_UP"],
-                            "instance": {
-                                "id": "id-4",
-                                "private-ip": "ip-4",
-                                "hostname": "hostname",
-                                "launch-time": "some_launch_time",
-                            },
-                            "partitions": ["queue1"],
-                            "queue-name": "queue1",
-                            "compute-resource": "c5xlarge",
-                            "last-busy-time": "2023-03-10T11:24:14.000+00:00",
-                            "slurm-started-time": None,
-                        },
-                        "count": 3,
-                    }
-                },
-                {
-                    "compute-node-idle-time": {
-                        "node-type": "static",
-                        "longest-idle-time": 129604.0,
-                        "longest-idle-node": {
-                            "name": "queue2-st-c5large-3",
-                            "type": "static",
-                            "address": "nodeip",
-                            "hostname": "nodehostname",
-                            "state-string": "IDLE+CLOUD",
-                            "state-reason": "(Code:UnauthorizedOperation)Error",
-                            "state": "IDLE",
-                            "state-flags": ["CLOUD"],
-                            "instance": {
-                                "id": "id-7",
-                                "private-ip": "ip-7",
-                                "hostname": "hostname",
-                                "launch-time": "some_launch_time",
-                            },
-                            "partitions": ["queue2"],
-                            "queue-name": "queue2",
-                            "compute-resource": "c5large",
-                            "last-busy-time": "2023-03-10T11:23:10.000+00:00",
-                            "slurm-started-time": None,
-                        },
-                        "count": 2,
-                    }
-                },
-                {"compute-node-state-count": {"node-state": "IDLE+CLOUD+POWERING_DOWN", "count": 2}},
-                {"compute-node-state-count": {"node-state": "IDLE+CLOUD", "count": 4}},
-                {"compute-node-state-count": {"node-state": "MIXED+CLOUD+NOT_RESPONDING+POWERING_UP", "count": 1}},
-                {"compute-node-state-count": {"node-state": "DOWN", "count": 1}},
-                {"compute-node-state-count": {"node-state": "IDLE+CLOUD+POWERING_UP", "count": 1}},
-                {"compute-node-state-count": {"node-state": "MIXED+CLOUD+POWERED_UP", "count": 1}},
-                {"compute-node-state-count": {"node-state": "DOWN+CLOUD", "count": 2}},
-                {"compute-node-state-count": {"node-state": "IDLE+CLOUD+POWERED_UP", "count": 1}},
-                {"cluster-instance-count": {"count": 13}},
-            ],
-            ["ERROR", "WARNING", "INFO"],
+            list(_SAMPLE_COMPUTE_NODES),
+            _INFO_LEVELS,
             None,
         ),
         (
-            [
-                StaticNode(
-                    "queue1-st-c5xlarge-2",
-                    "ip-2",
-                    "hostname",
-                    "IDLE+CLOUD+POWERING_DOWN",
-                    "queue1",
-                    instance=EC2Instance(
-                        id="id-1", private_ip="ip-1", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue-st-c5xlarge-1",
-                    "ip-3",
-                    "hostname",
-                    "IDLE+CLOUD",
-                    "queue",
-                    instance=EC2Instance(
-                        id="id-2", private_ip="ip-2", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue1-dy-c5xlarge-1",
-                    "ip-1",
-                    "hostname",
-                    "MIXED+CLOUD+NOT_RESPONDING+POWERING_UP",
-                    "queue1",
-                    instance=EC2Instance(
-                        id="id-2", private_ip="ip-2", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue1-st-c4xlarge-1",
-                    "ip-1",
-                    "hostname",
-                    "DOWN",
-                    "queue1",
-                    instance=EC2Instance(
-                        id="id-3", private_ip="ip-3", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue1-dy-c5xlarge-3",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD+POWERING_UP",
-                    "queue1",
-                    "(Code:InsufficientReservedInstanceCapacity)Failure when resuming nodes",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=10, hour=11, minute=24, second=14, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-4", private_ip="ip-4", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue2-dy-c5large-1",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD",
-                    "queue2",
-                    "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                    instance=EC2Instance(
-                        id="id-5", private_ip="ip-5", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue2-dy-c5large-2",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD+POWERING_DOWN",
-                    "queue2",
-                    "(Code:InsufficientHostCapacity)Error",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=10, hour=12, minute=23, second=14, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-6", private_ip="ip-6", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue2-st-c5large-3",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD",
-                    "queue2",
-                    "(Code:UnauthorizedOperation)Error",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=10, hour=11, minute=23, second=10, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-7", private_ip="ip-7", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue2-st-c5large-4",
-                    "nodeip",
-                    "nodehostname",
-                    "MIXED+CLOUD+POWERED_UP",
-                    "queue2",
-                    "(Code:InvalidBlockDeviceMapping)Error",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=10, hour=21, minute=23, second=14, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-8", private_ip="ip-8", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue2-dy-c5large-5",
-                    "nodeip",
-                    "nodehostname",
-                    "DOWN+CLOUD",
-                    "queue2",
-                    "(Code:AccessDeniedException)Error",
-                    instance=EC2Instance(
-                        id="id-9", private_ip="ip-9", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue2-st-c5large-6",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD+POWERED_UP",
-                    "queue2",
-                    "(Code:VcpuLimitExceeded)Error",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=10, hour=11, minute=25, second=14, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-10", private_ip="ip-10", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue2-st-c5large-8",
-                    "nodeip",
-                    "nodehostname",
-                    "DOWN+CLOUD",
-                    "queue2",
-                    "(Code:VolumeLimitExceeded)Error",
-                    instance=EC2Instance(
-                        id="id-11", private_ip="ip-11", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue2-dy-c5large-9",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD",
-                    "queue2",
-                    "(Code:InsufficientVolumeCapacity)Error",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=11, hour=11, minute=23, second=14, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-12", private_ip="ip-12", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-            ],
-            [
-                {
-                    "compute-node-idle-time": {
-                        "node-type": "dynamic",
-                        "longest-idle-time": 129540.0,
-                        "longest-idle-node": {
-                            "name": "queue1-dy-c5xlarge-3",
-                            "type": "dynamic",
-                            "address": "nodeip",
-                            "hostname": "nodehostname",
-                            "state-string": "IDLE+CLOUD+POWERING_UP",
-                            "state-reason": "(Code:InsufficientReservedInstanceCapacity)Failure when resuming nodes",
-                            "state": "IDLE",
-                            "state-flags": ["CLOUD", "POWERING_UP"],
-                            "instance": {
-                                "id": "id-4",
-                                "private-ip": "ip-4",
-                                "hostname": "hostname",
-                                "launch-time": "some_launch_time",
-                            },
-                            "partitions": ["queue1"],
-                            "queue-name": "queue1",
-                            "compute-resource": "c5xlarge",
-                            "last-busy-time": "2023-03-10T11:24:14.000+00:00",
-                            "slurm-started-time": None,
-                        },
-                        "count": 3,
-                    }
-                },
-                {
-                    "compute-node-idle-time": {
-                        "node-type": "static",
-                        "longest-idle-time": 129604.0,
-                        "longest-idle-node": {
-                            "name": "queue2-st-c5large-3",
-                            "type": "static",
-                            "address": "nodeip",
-                            "hostname": "nodehostname",
-                            "state-string": "IDLE+CLOUD",
-                            "state-reason": "(Code:UnauthorizedOperation)Error",
-                            "state": "IDLE",
-                            "state-flags": ["CLOUD"],
-                            "instance": {
-                                "id": "id-7",
-                                "private-ip": "ip-7",
-                                "hostname": "hostname",
-                                "launch-time": "some_launch_time",
-                            },
-                            "partitions": ["queue2"],
-                            "queue-name": "queue2",
-                            "compute-resource": "c5large",
-                            "last-busy-time": "2023-03-10T11:23:10.000+00:00",
-                            "slurm-started-time": None,
-                        },
-                        "count": 2,
-                    }
-                },
-                {"compute-node-state-count": {"node-state": "IDLE+CLOUD+POWERING_DOWN", "count": 2}},
-                {"compute-node-state-count": {"node-state": "IDLE+CLOUD", "count": 4}},
-                {"compute-node-state-count": {"node-state": "MIXED+CLOUD+NOT_RESPONDING+POWERING_UP", "count": 1}},
-                {"compute-node-state-count": {"node-state": "DOWN", "count": 1}},
-                {"compute-node-state-count": {"node-state": "IDLE+CLOUD+POWERING_UP", "count": 1}},
-                {"compute-node-state-count": {"node-state": "MIXED+CLOUD+POWERED_UP", "count": 1}},
-                {"compute-node-state-count": {"node-state": "DOWN+CLOUD", "count": 2}},
-                {"compute-node-state-count": {"node-state": "IDLE+CLOUD+POWERED_UP", "count": 1}},
-                {"cluster-instance-count": {"count": 13}},
-                {
-                    "compute-node-state": {
-                        "name": "queue1-st-c5xlarge-2",
-                        "type": "static",
-                        "address": "ip-2",
-                        "hostname": "hostname",
-                        "state-string": "IDLE+CLOUD+POWERING_DOWN",
-                        "state-reason": None,
-                        "state": "IDLE",
-                        "state-flags": ["CLOUD", "POWERING_DOWN"],
-                        "instance": {
-                            "id": "id-1",
-                            "private-ip": "ip-1",
-                            "hostname": "hostname",
-                            "launch-time": "some_launch_time",
-                        },
-                        "partitions": ["queue1"],
-                        "queue-name": "queue1",
-                        "compute-resource": "c5xlarge",
-                        "last-busy-time": None,
-                        "slurm-started-time": None,
-                    }
-                },
-                {
-                    "compute-node-state": {
-                        "name": "queue-st-c5xlarge-1",
-                        "type": "static",
-                        "address": "ip-3",
-                        "hostname": "hostname",
-                        "state-string": "IDLE+CLOUD",
-                        "state-reason": None,
-                        "state": "IDLE",
-                        "state-flags": ["CLOUD"],
-                        "instance": {
-                            "id": "id-2",
-                            "private-ip": "ip-2",
-                            "hostname": "hostname",
-                            "launch-time": "some_launch_time",
-                        },
-                        "partitions": ["queue"],
-                        "queue-name": "queue",
-                        "compute-resource": "c5xlarge",
-                        "last-busy-time": None,
-                        "slurm-started-time": None,
-                    }
-                },
-                {
-                    "compute-node-state": {
-                        "name": "queue1-dy-c5xlarge-1",
-                        "type": "dynamic",
-                        "address": "ip-1",
-                        "hostname": "hostname",
-                        "state-string": "MIXED+CLOUD+NOT_RESPONDING+POWERING_UP",
-                        "state-reason": None,
-                        "state": "MIXED",
-                        "state-flags": ["CLOUD", "NOT_RESPONDING", "POWERING_UP"],
-                        "instance": {
-                            "id": "id-2",
-                            "private-ip": "ip-2",
-                            "hostname": "hostname",
-                            "launch-time": "some_launch_time",
-                        },
-                        "partitions": ["queue1"],
-                        "queue-name": "queue1",
-                        "compute-resource": "c5xlarge",
-                        "last-busy-time": None,
-                        "slurm-started-time": None,
-                    }
-                },
-                {
-                    "compute-node-state": {
-                        "name": "queue1-st-c4xlarge-1",
-                        "type": "static",
-                        "address": "ip-1",
-                        "hostname": "hostname",
-                        "state-string": "DOWN",
-                        "state-reason": None,
-                        "state": "DOWN",
-                        "state-flags": [],
-                        "instance": {
-                            "id": "id-3",
-                            "private-ip": "ip-3",
-                            "hostname": "hostname",
-                            "launch-time": "some_launch_time",
-                        },
-                        "partitions": ["queue1"],
-                        "queue-name": "queue1",
-                        "compute-resource": "c4xlarge",
-                        "last-busy-time": None,
-                        "slurm-started-time": None,
-                    }
-                },
-                {
-                    "compute-node-state": {
-                        "name": "queue1-dy-c5xlarge-3",
-                        "type": "dynamic",
-                        "address": "nodeip",
-                        "hostname": "nodehostname",
-                        "state-string": "IDLE+CLOUD+POWERING_UP",
-                        "state-reason": "(Code:InsufficientReservedInstanceCapacity)Failure when resuming nodes",
-                        "state": "IDLE",
-                        "state-flags": ["CLOUD", "POWERING_UP"],
-                        "instance": {
-                            "id": "id-4",
-                            "private-ip": "ip-4",
-                            "hostname": "hostname",
-                            "launch-time": "some_launch_time",
-                        },
-                        "partitions": ["queue1"],
-                        "queue-name": "queue1",
-                        "compute-resource": "c5xlarge",
-                        "last-busy-time": "2023-03-10T11:24:14.000+00:00",
-                        "slurm-started-time": None,
-                    }
-                },
-                {
-                    "compute-node-state": {
-                        "name": "queue2-dy-c5large-1",
-                        "type": "dynamic",
-                        "address": "nodeip",
-                        "hostname": "nodehostname",
-                        "state-string": "IDLE+CLOUD",
-                        "state-reason": "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                        "state": "IDLE",
-                        "state-flags": ["CLOUD"],
-                        "instance": {
-                            "id": "id-5",
-                            "private-ip": "ip-5",
-                            "hostname": "hostname",
-                            "launch-time": "some_launch_time",
-                        },
-                        "partitions": ["queue2"],
-                        "queue-name": "queue2",
-                        "compute-resource": "c5large",
-                        "last-busy-time": None,
-                        "slurm-started-time": None,
-                    }
-                },
-                {
-                    "compute-node-state": {
-                        "name": "queue2-dy-c5large-2",
-                        "type": "dynamic",
-                        "address": "nodeip",
-                        "hostname": "nodehostname",
-                        "state-string": "IDLE+CLOUD+POWERING_DOWN",
-                        "state-reason": "(Code:InsufficientHostCapacity)Error",
-                        "state": "IDLE",
-                        "state-flags": ["CLOUD", "POWERING_DOWN"],
-                        "instance": {
-                            "id": "id-6",
-                            "private-ip": "ip-6",
-                            "hostname": "hostname",
-                            "launch-time": "some_launch_time",
-                        },
-                        "partitions": ["queue2"],
-                        "queue-name": "queue2",
-                        "compute-resource": "c5large",
-                        "last-busy-time": "2023-03-10T12:23:14.000+00:00",
-                        "slurm-started-time": None,
-                    }
-                },
-                {
-                    "compute-node-state": {
-                        "name": "queue2-st-c5large-3",
-                        "type": "static",
-                        "address": "nodeip",
-                        "hostname": "nodehostname",
-                        "state-string": "IDLE+CLOUD",
-                        "state-reason": "(Code:UnauthorizedOperation)Error",
-                        "state": "IDLE",
-                        "state-flags": ["CLOUD"],
-                        "instance": {
-                            "id": "id-7",
-                            "private-ip": "ip-7",
-                            "hostname": "hostname",
-                            "launch-time": "some_launch_time",
-                        },
-                        "partitions": ["queue2"],
-                        "queue-name": "queue2",
-                        "compute-resource": "c5large",
-                        "last-busy-time": "2023-03-10T11:23:10.000+00:00",
-                        "slurm-started-time": None,
-                    }
-                },
-                {
-                    "compute-node-state": {
-                        "name": "queue2-st-c5large-4",
-                        "type": "static",
-                        "address": "nodeip",
-                        "hostname": "nodehostname",
-                        "state-string": "MIXED+CLOUD+POWERED_UP",
-                        "state-reason": "(Code:InvalidBlockDeviceMapping)Error",
-                        "state": "MIXED",
-                        "state-flags": ["CLOUD", "POWERED_UP"],
-                        "instance": {
-                            "id": "id-8",
-                            "private-ip": "ip-8",
-                            "hostname": "hostname",
-                            "launch-time": "some_launch_time",
-                        },
-                        "partitions": ["queue2"],
-                        "queue-name": "queue2",
-                        "compute-resource": "c5large",
-                        "last-busy-time": "2023-03-10T21:23:14.000+00:00",
-                        "slurm-started-time": None,
-                    }
-                },
-                {
-                    "compute-node-state": {
-                        "name": "queue2-dy-c5large-5",
-                        "type": "dynamic",
-                        "address": "nodeip",
-                        "hostname": "nodehostname",
-                        "state-string": "DOWN+CLOUD",
-                        "state-reason": "(Code:AccessDeniedException)Error",
-                        "state": "DOWN",
-                        "state-flags": ["CLOUD"],
-                        "instance": {
-                            "id": "id-9",
-                            "private-ip": "ip-9",
-                            "hostname": "hostname",
-                            "launch-time": "some_launch_time",
-                        },
-                        "partitions": ["queue2"],
-                        "queue-name": "queue2",
-                        "compute-resource": "c5large",
-                        "last-busy-time": None,
-                        "slurm-started-time": None,
-                    }
-                },
-                {
-                    "compute-node-state": {
-                        "name": "queue2-st-c5large-6",
-                        "type": "static",
-                        "address": "nodeip",
-                        "hostname": "nodehostname",
-                        "state-string": "IDLE+CLOUD+POWERED_UP",
-                        "state-reason": "(Code:VcpuLimitExceeded)Error",
-                        "state": "IDLE",
-                        "state-flags": ["CLOUD", "POWERED_UP"],
-                        "instance": {
-                            "id": "id-10",
-                            "private-ip": "ip-10",
-                            "hostname": "hostname",
-                            "launch-time": "some_launch_time",
-                        },
-                        "partitions": ["queue2"],
-                        "queue-name": "queue2",
-                        "compute-resource": "c5large",
-                        "last-busy-time": "2023-03-10T11:25:14.000+00:00",
-                        "slurm-started-time": None,
-                    }
-                },
-                {
-                    "compute-node-state": {
-                        "name": "queue2-st-c5large-8",
-                        "type": "static",
-                        "address": "nodeip",
-                        "hostname": "nodehostname",
-                        "state-string": "DOWN+CLOUD",
-                        "state-reason": "(Code:VolumeLimitExceeded)Error",
-                        "state": "DOWN",
-                        "state-flags": ["CLOUD"],
-                        "instance": {
-                            "id": "id-11",
-                            "private-ip": "ip-11",
-                            "hostname": "hostname",
-                            "launch-time": "some_launch_time",
-                        },
-                        "partitions": ["queue2"],
-                        "queue-name": "queue2",
-                        "compute-resource": "c5large",
-                        "last-busy-time": None,
-                        "slurm-started-time": None,
-                    }
-                },
-                {
-                    "compute-node-state": {
-                        "name": "queue2-dy-c5large-9",
-                        "type": "dynamic",
-                        "address": "nodeip",
-                        "hostname": "nodehostname",
-                        "state-string": "IDLE+CLOUD",
-                        "state-reason": "(Code:InsufficientVolumeCapacity)Error",
-                        "state": "IDLE",
-                        "state-flags": ["CLOUD"],
-                        "instance": {
-                            "id": "id-12",
-                            "private-ip": "ip-12",
-                            "hostname": "hostname",
-                            "launch-time": "some_launch_time",
-                        },
-                        "partitions": ["queue2"],
-                        "queue-name": "queue2",
-                        "compute-resource": "c5large",
-                        "last-busy-time": "2023-03-11T11:23:14.000+00:00",
-                        "slurm-started-time": None,
-                    }
-                },
-            ],
+            list(_SAMPLE_COMPUTE_NODES),
             ["ERROR", "WARNING", "INFO", "DEBUG"],
             None,
         ),
         (
-            [
-                StaticNode(
-                    "queue1-st-c5xlarge-2",
-                    "ip-2",
-                    "hostname",
-                    "IDLE+CLOUD+POWERING_DOWN",
-                    "queue1",
-                    instance=EC2Instance(
-                        id="id-1", private_ip="ip-1", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue-st-c5xlarge-1",
-                    "ip-3",
-                    "hostname",
-                    "IDLE+CLOUD",
-                    "queue",
-                    instance=EC2Instance(
-                        id="id-2", private_ip="ip-2", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue1-dy-c5xlarge-1",
-                    "ip-1",
-                    "hostname",
-                    "MIXED+CLOUD+NOT_RESPONDING+POWERING_UP",
-                    "queue1",
-                    instance=EC2Instance(
-                        id="id-2", private_ip="ip-2", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue1-st-c4xlarge-1",
-                    "ip-1",
-                    "hostname",
-                    "DOWN",
-                    "queue1",
-                    instance=EC2Instance(
-                        id="id-3", private_ip="ip-3", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue1-dy-c5xlarge-3",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD+POWERING_UP",
-                    "queue1",
-                    "(Code:InsufficientReservedInstanceCapacity)Failure when resuming nodes",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=10, hour=11, minute=24, second=14, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-4", private_ip="ip-4", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue2-dy-c5large-1",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD",
-                    "queue2",
-                    "(Code:InsufficientHostCapacity)Failure when resuming nodes",
-                    instance=EC2Instance(
-                        id="id-5", private_ip="ip-5", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue2-dy-c5large-2",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD+POWERING_DOWN",
-                    "queue2",
-                    "(Code:InsufficientHostCapacity)Error",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=10, hour=12, minute=23, second=14, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-6", private_ip="ip-6", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue2-st-c5large-3",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD",
-                    "queue2",
-                    "(Code:UnauthorizedOperation)Error",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=10, hour=11, minute=23, second=10, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-7", private_ip="ip-7", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue2-st-c5large-4",
-                    "nodeip",
-                    "nodehostname",
-                    "MIXED+CLOUD+POWERED_UP",
-                    "queue2",
-                    "(Code:InvalidBlockDeviceMapping)Error",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=10, hour=21, minute=23, second=14, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-8", private_ip="ip-8", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue2-dy-c5large-5",
-                    "nodeip",
-                    "nodehostname",
-                    "DOWN+CLOUD",
-                    "queue2",
-                    "(Code:AccessDeniedException)Error",
-                    instance=EC2Instance(
-                        id="id-9", private_ip="ip-9", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue2-st-c5large-6",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD+POWERED_UP",
-                    "queue2",
-                    "(Code:VcpuLimitExceeded)Error",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=10, hour=11, minute=25, second=14, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-10", private_ip="ip-10", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                StaticNode(
-                    "queue2-st-c5large-8",
-                    "nodeip",
-                    "nodehostname",
-                    "DOWN+CLOUD",
-                    "queue2",
-                    "(Code:VolumeLimitExceeded)Error",
-                    instance=EC2Instance(
-                        id="id-11", private_ip="ip-11", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-                DynamicNode(
-                    "queue2-dy-c5large-9",
-                    "nodeip",
-                    "nodehostname",
-                    "IDLE+CLOUD",
-                    "queue2",
-                    "(Code:InsufficientVolumeCapacity)Error",
-                    lastbusytime=datetime(
-                        year=2023, month=3, day=11, hour=11, minute=23, second=14, tzinfo=timezone.utc
-                    ),
-                    instance=EC2Instance(
-                        id="id-12", private_ip="ip-12", hostname="hostname", launch_time="some_launch_time"
-                    ),
-                ),
-            ],
-            [],
+            list(_SAMPLE_COMPUTE_NODES),
             ["ERROR", "WARNING"],
             None,
         ),
@@ -2690,11 +1821,10 @@ def test_publish_node_launch_events(failed_nodes, expected_details, level_filter
         "nothing-at-warning",
     ],
 )
-def test_publish_compute_node_events(compute_nodes, expected_details, level_filter, max_list_size, mocker):
-    received_events = []
-    event_publisher = ClusterEventPublisher(
-        event_handler(received_events, level_filter=level_filter), max_list_size=max_list_size
-    )
+def test_publish_compute_node_events(
+    compute_nodes, level_filter, max_list_size, mocker, publisher_and_events, test_datadir, request
+):
+    event_publisher, received_events = publisher_and_events(level_filter, max_list_size=max_list_size)
     test_time = datetime(year=2023, month=3, day=11, hour=23, minute=23, second=14, tzinfo=timezone.utc)
 
     # Run test
@@ -2706,6 +1836,5 @@ def test_publish_compute_node_events(compute_nodes, expected_details, level_filt
     event_publisher.publish_compute_node_events(compute_nodes, cluster_instances)
 
     # Assert calls
-    assert_that(received_events).is_length(len(expected_details))
-    for received_event, expected_detail in zip(received_events, expected_details):
-        assert_that(received_event).is_equal_to(expected_detail)
+    expected_events_path = test_datadir / request.node.callspec.id / "expected_events.json"
+    assert received_events == json.loads(expected_events_path.read_text())
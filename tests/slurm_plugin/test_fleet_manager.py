@@ -950,3 +950,15 @@ class TestCreateFleetManager:
         instance_info = ec2_client.describe_instances(InstanceIds=instance_ids)["Reservations"][0]["Instances"][0]
         instance_description = EC2Instance.from_describe_instance_data(instance_info)
         assert_that(expected_result).is_equal_to(instance_description.private_ip)
+
+
+class TestEC2Instance:
+    def test_equality_and_repr(self):
+        instance = EC2Instance("id-1", "ip-1", "hostname-1", "some_launch_time")
+
+        assert_that(instance).is_equal_to(EC2Instance("id-1", "ip-1", "hostname-1", "some_launch_time"))
+        assert_that(instance).is_not_equal_to(EC2Instance("id-1", "ip-2", "hostname-1", "some_launch_time"))
+        assert_that(repr(instance)).is_equal_to(
+            "EC2Instance(id='id-1', private_ip='ip-1', hostname='hostname-1', launch_time='some_launch_time', "
+            "slurm_node=None)"
+        )